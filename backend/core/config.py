@@ -1,4 +1,6 @@
 import os
+from functools import cached_property
+from typing import Any
 
 def env(name: str, default: str | None = None) -> str:
     val = os.environ.get(name, default)
@@ -9,26 +11,89 @@ def env(name: str, default: str | None = None) -> str:
 def env_optional(name: str, default: str | None = None) -> str | None:
     return os.environ.get(name, default)
 
-MONGO_URL = env("MONGO_URL")
-DB_NAME = env("DB_NAME")
-FRONTEND_URL = env("FRONTEND_URL").rstrip("/")
 
-STRIPE_API_KEY = env("STRIPE_API_KEY")
-STRIPE_WEBHOOK_SECRET = env("STRIPE_WEBHOOK_SECRET")
+class Settings:
+    """
+    Typed app settings, resolved and validated on first access rather than at import.
+    A missing required var fails the code path that needs it, not the whole process.
+    """
 
-STRIPE_PRICE_PRO_MONTHLY = env("STRIPE_PRICE_PRO_MONTHLY")
-STRIPE_PRICE_ELITE_MONTHLY = env("STRIPE_PRICE_ELITE_MONTHLY")
+    @cached_property
+    def mongo_url(self) -> str:
+        return env("MONGO_URL")
 
-STRIPE_PRICE_LAUNCH_AUTHORITY = env_optional("STRIPE_PRICE_LAUNCH_AUTHORITY")
-STRIPE_PRICE_GROWTH_OPERATOR = env_optional("STRIPE_PRICE_GROWTH_OPERATOR")
-STRIPE_PRICE_VENTURE_ARCHITECT = env_optional("STRIPE_PRICE_VENTURE_ARCHITECT")
+    @cached_property
+    def db_name(self) -> str:
+        return env("DB_NAME")
 
-STRIPE_CONNECT_RETURN_URL = env_optional(
-    "STRIPE_CONNECT_RETURN_URL",
-    f"{FRONTEND_URL}/partners/return"
-)
+    @cached_property
+    def frontend_url(self) -> str:
+        return env("FRONTEND_URL").rstrip("/")
 
-STRIPE_CONNECT_REFRESH_URL = env_optional(
-    "STRIPE_CONNECT_REFRESH_URL",
-    f"{FRONTEND_URL}/partners/refresh"
-)
+    @cached_property
+    def stripe_api_key(self) -> str:
+        # STRIPE_SECRET_KEY accepted for older Render env groups
+        return env("STRIPE_API_KEY", os.environ.get("STRIPE_SECRET_KEY"))
+
+    @cached_property
+    def stripe_webhook_secret(self) -> str:
+        return env("STRIPE_WEBHOOK_SECRET")
+
+    @cached_property
+    def stripe_connect_return_url(self) -> str:
+        return env_optional("STRIPE_CONNECT_RETURN_URL") or f"{self.frontend_url}/partners/return"
+
+    @cached_property
+    def stripe_connect_refresh_url(self) -> str:
+        return env_optional("STRIPE_CONNECT_REFRESH_URL") or f"{self.frontend_url}/partners/refresh"
+
+    # Stripe price ids (STRIPE_PRICE_*) are read by services/plan_registry.py
+    @cached_property
+    def plan_reload_poll_seconds(self) -> float:
+        return float(env_optional("PLAN_RELOAD_POLL_SECONDS", "30"))
+
+    # Background job worker (python worker.py)
+    @cached_property
+    def job_worker_concurrency(self) -> int:
+        return int(env_optional("JOB_WORKER_CONCURRENCY", "4"))
+
+    @cached_property
+    def job_worker_poll_seconds(self) -> float:
+        return float(env_optional("JOB_WORKER_POLL_SECONDS", "1.0"))
+
+    @cached_property
+    def job_lease_seconds(self) -> int:
+        return int(env_optional("JOB_LEASE_SECONDS", "60"))
+
+    # Analytics event buffer (services/analytics_service.py)
+    @cached_property
+    def analytics_max_events(self) -> int:
+        return int(env_optional("ANALYTICS_MAX_EVENTS", "10000"))
+
+    @cached_property
+    def analytics_batch_size(self) -> int:
+        return int(env_optional("ANALYTICS_BATCH_SIZE", "500"))
+
+    @cached_property
+    def analytics_flush_seconds(self) -> float:
+        return float(env_optional("ANALYTICS_FLUSH_SECONDS", "5"))
+
+    def validate(self) -> None:
+        """
+        Resolve every setting now; raises ValueError on the first missing/invalid one.
+        """
+        for name, attr in type(self).__dict__.items():
+            if isinstance(attr, cached_property):
+                getattr(self, name)
+
+
+settings = Settings()
+
+
+def __getattr__(name: str) -> Any:
+    # Back-compat for `from core.config import FRONTEND_URL`-style imports.
+    # Note that a from-import resolves the value at the importer's import time.
+    attr = name.lower()
+    if name.isupper() and isinstance(getattr(Settings, attr, None), cached_property):
+        return getattr(settings, attr)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,4 @@
-from motor.motor_asyncio import AsyncIOMotorClient
-from core.config import MONGO_URL, DB_NAME
+from core.config import settings
 
 _client = None
 _db = None
@@ -7,11 +6,13 @@ _db = None
 def get_client():
     global _client
     if _client is None:
-        _client = AsyncIOMotorClient(MONGO_URL)
+        # deferred: motor/pymongo are the heaviest imports in the app
+        from motor.motor_asyncio import AsyncIOMotorClient
+        _client = AsyncIOMotorClient(settings.mongo_url)
     return _client
 
 def get_db():
     global _db
     if _db is None:
-        _db = get_client()[DB_NAME]
+        _db = get_client()[settings.db_name]
     return _db
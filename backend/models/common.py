@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+class StatusResponse(BaseModel):
+    status: str
+
+class ServiceStatusResponse(BaseModel):
+    status: str
+    service: str
+
+class OkResponse(BaseModel):
+    ok: bool = True
@@ -2,16 +2,19 @@ from pydantic import BaseModel, Field, EmailStr
 from typing import Optional, Dict, Any, List
 
 class CheckoutRequest(BaseModel):
-    tier: str
-    email: EmailStr
+    plan: str
     user_id: str
+    email: EmailStr
     origin_url: Optional[str] = None
+    intent_id: Optional[str] = None
+    customer_id: Optional[str] = None
+    ref_id: Optional[str] = None
 
 class CheckoutResponse(BaseModel):
-    success: bool
-    session_id: Optional[str] = None
-    checkout_url: Optional[str] = None
-    error: Optional[str] = None
+    id: str
+    url: Optional[str] = None
+    mode: str
+    price_id: str
 
 class TierInfo(BaseModel):
     name: str
@@ -20,3 +23,10 @@ class TierInfo(BaseModel):
     price_display: str
     stripe_price_env: Optional[str] = None
     one_time: bool = False
+
+class PricingResponse(BaseModel):
+    pro_monthly: Optional[str] = None
+    elite_monthly: Optional[str] = None
+    launch_authority: Optional[str] = None
+    growth_operator: Optional[str] = None
+    venture_architect: Optional[str] = None
@@ -1,7 +1,2 @@
-import stripe
-from core.config import STRIPE_SECRET_KEY, STRIPE_WEBHOOK_SECRET
-
-stripe.api_key = STRIPE_SECRET_KEY
-
-def construct_event(payload: bytes, sig_header: str):
-    return stripe.Webhook.construct_event(payload, sig_header, STRIPE_WEBHOOK_SECRET)
+# Moved to services/stripe_service.py; kept so old imports keep working.
+from services.stripe_service import get_stripe, construct_event, InvalidWebhookError  # noqa: F401
@@ -1,18 +1,22 @@
-from fastapi import APIRouter, Body
+from fastapi import APIRouter, HTTPException
+from models.pricing import CheckoutRequest, CheckoutResponse
 from services.billing_service import create_checkout_session
+from services.plan_registry import InvalidPlanError
 
 router = APIRouter(prefix="/billing", tags=["billing"])
 
-@router.post("/checkout")
-async def checkout(payload: dict = Body(...)):
-    # Expected payload keys (adjust to your frontend):
-    # plan, user_id, email, origin_url(optional), intent_id(optional), customer_id(optional), ref_id(optional)
-    return await create_checkout_session(
-        plan=payload["plan"],
-        user_id=payload["user_id"],
-        email=payload["email"],
-        origin_url=payload.get("origin_url"),
-        intent_id=payload.get("intent_id"),
-        customer_id=payload.get("customer_id"),
-        ref_id=payload.get("ref_id"),
-    )
+@router.post("/checkout", response_model=CheckoutResponse)
+async def checkout(payload: CheckoutRequest):
+    try:
+        return await create_checkout_session(
+            plan=payload.plan,
+            user_id=payload.user_id,
+            email=payload.email,
+            origin_url=payload.origin_url,
+            intent_id=payload.intent_id,
+            customer_id=payload.customer_id,
+            ref_id=payload.ref_id,
+        )
+    except InvalidPlanError as e:
+        # only a bad plan is the client's fault; config errors surface as 500s
+        raise HTTPException(status_code=400, detail=str(e))
@@ -1,7 +1,8 @@
 from fastapi import APIRouter
+from models.common import OkResponse
 
 router = APIRouter(prefix="/founders", tags=["founders"])
 
-@router.get("/")
+@router.get("/", response_model=OkResponse)
 def founders():
     return {"ok": True}
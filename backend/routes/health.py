@@ -1,7 +1,26 @@
+import logging
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from core.config import settings
+from models.common import StatusResponse
+
+logger = logging.getLogger("PEN2PRO_V2")
 
 router = APIRouter(prefix="/api", tags=["health"])
 
-@router.get("/health")
+@router.get("/health", response_model=StatusResponse)
 async def health():
     return {"status": "ok"}
+
+@router.get("/health/ready", response_model=StatusResponse, responses={503: {"model": StatusResponse}})
+async def ready():
+    """
+    Readiness probe: resolves every setting so a missing/invalid env var shows up
+    here instead of on the first request that needs it. Details go to the log only.
+    """
+    try:
+        settings.validate()
+    except ValueError as e:
+        logger.error("Settings invalid: %s", e)
+        return JSONResponse(status_code=503, content={"status": "misconfigured"})
+    return {"status": "ok"}
@@ -1,7 +1,8 @@
 from fastapi import APIRouter
+from models.common import OkResponse
 
 router = APIRouter(prefix="/marketplace", tags=["marketplace"])
 
-@router.get("/")
+@router.get("/", response_model=OkResponse)
 def marketplace():
     return {"ok": True}
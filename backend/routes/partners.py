@@ -1,7 +1,8 @@
 from fastapi import APIRouter
+from models.common import OkResponse
 
 router = APIRouter(prefix="/partners", tags=["partners"])
 
-@router.get("/")
+@router.get("/", response_model=OkResponse)
 def partners():
     return {"ok": True}
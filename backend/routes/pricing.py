@@ -1,29 +1,36 @@
 from fastapi import APIRouter
-from services.pricing_service import get_pricing_data
-from typing import Optional
-import os
+from models.common import StatusResponse
+from models.pricing import PricingResponse
+from services.plan_registry import get_registry
+from services.analytics_service import track, PRICING_VIEWED
 
 router = APIRouter()
 
-def get_env(name: str) -> Optional[str]:
-    return os.getenv(name)
+# Response key -> plan key (response keys kept for the existing frontend)
+PRICING_RESPONSE_KEYS = {
+    "pro_monthly": "pro",
+    "elite_monthly": "elite",
+    "launch_authority": "launch_authority",
+    "growth_operator": "growth_operator",
+    "venture_architect": "venture_architect",
+}
 
-@router.get("/api/pricing")
+
+@router.get("/api/pricing", response_model=PricingResponse)
 def get_pricing():
     """
-    Returns Stripe price IDs configured in environment variables.
+    Returns Stripe price IDs from the plan registry.
     Does NOT crash if missing.
     """
-
-    return {
-        "pro_monthly": get_env("STRIPE_PRICE_PRO_MONTHLY"),
-        "elite_monthly": get_env("STRIPE_PRICE_ELITE_MONTHLY"),
-        "launch_authority": get_env("STRIPE_PRICE_LAUNCH_AUTHORITY"),
-        "growth_operator": get_env("STRIPE_PRICE_GROWTH_OPERATOR"),
-        "venture_architect": get_env("STRIPE_PRICE_VENTURE_ARCHITECT"),
-    }
+    track(PRICING_VIEWED)
+    registry = get_registry()
+    out = {}
+    for field, key in PRICING_RESPONSE_KEYS.items():
+        plan = registry.get(key)
+        out[field] = plan.stripe_price_id if plan else None
+    return out
 
 
-@router.get("/api/pricing/health")
+@router.get("/api/pricing/health", response_model=StatusResponse)
 def pricing_health():
     return {"status": "pricing router active"}
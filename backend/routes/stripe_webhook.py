@@ -1,30 +1,28 @@
 from fastapi import APIRouter, Request, Header, HTTPException
-import stripe
-import os
+from models.common import StatusResponse
+from services.stripe_service import InvalidWebhookError, construct_event
+from services.analytics_service import track, WEBHOOK_COMPLETED
 
 router = APIRouter()
 
-stripe.api_key = os.getenv("STRIPE_API_KEY")
-webhook_secret = os.getenv("STRIPE_WEBHOOK_SECRET")
 
-
-@router.post("/api/webhooks/stripe")
+@router.post("/api/webhooks/stripe", response_model=StatusResponse)
 async def stripe_webhook(request: Request, stripe_signature: str = Header(None)):
     payload = await request.body()
 
     try:
-        event = stripe.Webhook.construct_event(
-            payload,
-            stripe_signature,
-            webhook_secret
-        )
-    except stripe.error.SignatureVerificationError:
-        raise HTTPException(status_code=400, detail="Invalid signature")
+        event = construct_event(payload, stripe_signature)
+    except InvalidWebhookError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     # Handle event types
     if event["type"] == "checkout.session.completed":
         session = event["data"]["object"]
         print("Checkout completed:", session["id"])
+        # StripeObject isn't a dict (no .get) on current SDKs; use item access
+        metadata = session["metadata"] if "metadata" in session else None
+        plan = metadata["plan"] if metadata and "plan" in metadata else None
+        track(WEBHOOK_COMPLETED, session_id=session["id"], plan=plan)
 
     elif event["type"] == "invoice.paid":
         print("Invoice paid")
@@ -0,0 +1,74 @@
+"""
+Per-request response serialization overhead for the checkout, pricing and webhook routes.
+
+    python scripts/bench_serialization.py [--number 20000]
+
+Compares the old path (route returns a plain dict -> jsonable_encoder -> JSONResponse)
+with the typed path FastAPI now takes (validate into the route's response_model, then
+pydantic-core dump_json). Both produce the same bytes; only serialization is timed,
+not Stripe/Mongo.
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from models.common import StatusResponse  # noqa: E402
+from models.pricing import CheckoutResponse, PricingResponse  # noqa: E402
+
+CASES = {
+    "POST /billing/checkout": (
+        CheckoutResponse,
+        {
+            "id": "cs_test_a1B2c3D4e5F6g7H8i9J0kLmNoPqRsTuVwXyZ",
+            "url": "https://checkout.stripe.com/c/pay/cs_test_a1B2c3D4e5F6g7H8i9J0kLmNoPqRsTuVwXyZ#fidkdWxOYHwnPyd1blpxYHZxWjA0",
+            "mode": "payment",
+            "price_id": "price_1PqRsTuVwXyZaBcDeFgHiJkL",
+        },
+    ),
+    "GET /api/pricing": (
+        PricingResponse,
+        {
+            "pro_monthly": "price_1ProMonthlyXXXXXXXXXXXX",
+            "elite_monthly": "price_1EliteMonthlyXXXXXXXXXX",
+            "launch_authority": "price_1LaunchAuthorityXXXXXXX",
+            "growth_operator": "price_1GrowthOperatorXXXXXXXX",
+            "venture_architect": None,
+        },
+    ),
+    "POST /api/webhooks/stripe": (StatusResponse, {"status": "success"}),
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'route':<28} {'dict+encoder us':>16} {'typed us':>10} {'speedup':>8}")
+    for route, (model, payload) in CASES.items():
+        # built once, like FastAPI does per route at startup
+        adapter = TypeAdapter(model)
+
+        def old():
+            return JSONResponse(jsonable_encoder(payload)).body
+
+        def new():
+            return adapter.dump_json(adapter.validate_python(payload))
+
+        assert json.loads(old()) == json.loads(new()), route
+        old_us = min(timeit.repeat(old, number=args.number, repeat=5)) / args.number * 1e6
+        new_us = min(timeit.repeat(new, number=args.number, repeat=5)) / args.number * 1e6
+        print(f"{route:<28} {old_us:16.2f} {new_us:10.2f} {old_us / new_us:7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,91 @@
+"""
+Import-time profile and startup budget check for `server:app`.
+
+    python scripts/profile_imports.py                 # top 25 imports by cumulative time
+    python scripts/profile_imports.py --check         # exit 1 if import exceeds the budget
+    python scripts/profile_imports.py --budget-ms 800 --runs 7 --check
+
+Each measurement runs in a fresh interpreter so module caches don't hide the cost.
+Run it from backend/ (or anywhere; it chdirs to backend/).
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", "1000"))
+
+_TIMED_IMPORT = (
+    "import time; t = time.perf_counter(); "
+    "import server; server.app; "
+    "print((time.perf_counter() - t) * 1000)"
+)
+
+
+def _run(args):
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def measure_ms(runs: int) -> list:
+    samples = []
+    for _ in range(runs):
+        proc = _run(["-c", _TIMED_IMPORT])
+        if proc.returncode != 0:
+            sys.stderr.write(proc.stderr)
+            raise SystemExit(f"importing server:app failed (exit {proc.returncode})")
+        samples.append(float(proc.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def top_imports(limit: int) -> list:
+    """
+    Parse `python -X importtime` output into (cumulative_us, self_us, module) rows.
+    """
+    proc = _run(["-X", "importtime", "-c", "import server; server.app"])
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(cum_us), int(self_us), name.rstrip()))
+    rows.sort(reverse=True)
+    return rows[:limit]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--check", action="store_true", help="only measure; exit 1 if over budget")
+    args = parser.parse_args()
+
+    if not args.check:
+        print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for cum_us, self_us, name in top_imports(args.top):
+            print(f"{cum_us / 1000:14.1f} {self_us / 1000:9.1f}  {name}")
+        print()
+
+    samples = measure_ms(args.runs)
+    median = statistics.median(samples)
+    print(f"import server:app median {median:.1f} ms over {args.runs} runs "
+          f"(min {min(samples):.1f}, max {max(samples):.1f}); budget {args.budget_ms:.0f} ms")
+
+    if median > args.budget_ms:
+        print("FAIL: startup import budget exceeded")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
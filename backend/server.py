@@ -1,8 +1,13 @@
+import asyncio
 import logging
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
+from core.config import settings
 from db.mongo import get_client
+from models.common import ServiceStatusResponse
+from services.plan_registry import reload_plans, watch_plans
+from services import analytics_service
 
 # Routers
 from routes.health import router as health_router
@@ -14,6 +19,9 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("PEN2PRO_V2")
 
 # Create app ONCE
+# Every route declares a response_model and the default response class is left alone:
+# that lets FastAPI serialize straight to JSON bytes with pydantic-core instead of
+# jsonable_encoder + json.dumps (a custom default_response_class disables that path).
 app = FastAPI(title="PEN2PRO V2", version="2.0.0")
 
 # CORS (tighten allow_origins later to your real frontend domain)
@@ -31,8 +39,30 @@ async def startup():
     _ = get_client()
     logger.info("Mongo client initialized")
 
+    # Env catalog is loaded at import; overlay Mongo plans and keep them in sync
+    try:
+        await reload_plans()
+    except Exception:
+        logger.exception("Initial plan load from Mongo failed; serving env catalog")
+    app.state.plan_watcher = asyncio.create_task(watch_plans(settings.plan_reload_poll_seconds))
+
+    try:
+        await analytics_service.ensure_indexes()
+    except Exception:
+        logger.exception("Analytics index creation failed")
+    analytics_service.get_buffer().start()
+
+@app.on_event("shutdown")
+async def shutdown():
+    watcher = getattr(app.state, "plan_watcher", None)
+    if watcher:
+        watcher.cancel()
+
+    # write out buffered analytics events before the process exits
+    await analytics_service.get_buffer().stop()
+
 # Basic root
-@app.get("/")
+@app.get("/", response_model=ServiceStatusResponse)
 async def root():
     return {"status": "ok", "service": "PEN2PRO V2"}
 
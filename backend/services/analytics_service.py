@@ -0,0 +1,216 @@
+import asyncio
+import logging
+from collections import Counter, deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.config import settings
+from db.mongo import get_db
+
+logger = logging.getLogger("PEN2PRO_V2.analytics")
+
+# Funnel steps, in order
+PRICING_VIEWED = "pricing_viewed"
+CHECKOUT_CREATED = "checkout_created"
+WEBHOOK_COMPLETED = "webhook_completed"
+FOUNDER_PROVISIONED = "founder_provisioned"
+PAYOUT_SENT = "payout_sent"
+
+FUNNEL = (PRICING_VIEWED, CHECKOUT_CREATED, WEBHOOK_COMPLETED, FOUNDER_PROVISIONED, PAYOUT_SENT)
+
+
+def _hour(ts: datetime) -> datetime:
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+class EventBuffer:
+    """
+    Write-behind event log. track() is an O(1) deque append on the request path;
+    events are written with insert_many once `batch_size` are pending or every
+    `flush_seconds`, and hourly per-event counts are $inc'd into event_rollups in
+    the same flush. The deque is bounded: when Mongo falls behind the oldest
+    events are dropped (and counted) instead of growing memory. A failed write
+    puts its batch back, so an outage only loses what the bound forces out.
+    """
+
+    def __init__(self, max_events: int, batch_size: int, flush_seconds: float):
+        self._events: deque = deque(maxlen=max_events)
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.dropped = 0
+        self._lock = asyncio.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer: Optional[asyncio.Task] = None
+        self._pending_flush: Optional[asyncio.Task] = None
+        # rollup counts for persisted events whose $inc hasn't been written yet
+        self._rollup_backlog: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def track(self, name: str, **props: Any) -> None:
+        """
+        Safe from the event loop and from threadpool (sync def) route handlers.
+        """
+        if len(self._events) == self._events.maxlen:
+            self.dropped += 1
+        self._events.append({"name": name, "ts": datetime.now(timezone.utc), "props": props})
+
+        if len(self._events) >= self.batch_size and (self._pending_flush is None or self._pending_flush.done()):
+            loop = self._loop
+            if loop is None:
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    # no loop (scripts): the shutdown flush picks it up
+                    return
+            loop.call_soon_threadsafe(self._schedule_flush)
+
+    def _schedule_flush(self) -> None:
+        # runs on the loop thread
+        if self._pending_flush is None or self._pending_flush.done():
+            self._pending_flush = asyncio.get_running_loop().create_task(self.flush())
+
+    def _requeue(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Put unwritten events back at the front. If newer events have filled the
+        deque meanwhile, the oldest of the batch are the ones dropped.
+        """
+        room = self._events.maxlen - len(self._events)
+        if len(batch) > room:
+            self.dropped += len(batch) - room
+            batch = batch[len(batch) - room:]
+        self._events.extendleft(reversed(batch))
+
+    async def flush(self) -> int:
+        """
+        Drain the buffer in batch_size chunks. Returns the number of events written.
+        Stops at the first failed insert; unwritten events stay buffered for the next flush.
+        """
+        written = 0
+        async with self._lock:
+            while self._events:
+                n = min(self.batch_size, len(self._events))
+                batch: List[Dict[str, Any]] = [self._events.popleft() for _ in range(n)]
+                persisted, failed = await self._insert(batch)
+                written += len(persisted)
+                self._rollup_backlog.update((_hour(e["ts"]), e["name"]) for e in persisted)
+                if failed:
+                    self._requeue(failed)
+                    break
+            await self._write_rollups()
+        return written
+
+    async def _insert(self, batch: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        insert_many the batch; returns (persisted, failed). insert_many assigns each
+        event its _id in place, so a retried event that already landed comes back as a
+        duplicate-key error and is treated as persisted.
+        """
+        from pymongo.errors import BulkWriteError
+
+        try:
+            await get_db().events.insert_many(batch, ordered=False)
+        except BulkWriteError as e:
+            failed_idx = {err["index"] for err in e.details.get("writeErrors", []) if err.get("code") != 11000}
+            if e.details.get("writeConcernErrors"):
+                logger.warning("Analytics insert had write concern errors: %s", e.details["writeConcernErrors"])
+            if failed_idx:
+                logger.error("Analytics insert failed for %s of %s events; requeued", len(failed_idx), len(batch))
+            return (
+                [ev for i, ev in enumerate(batch) if i not in failed_idx],
+                [ev for i, ev in enumerate(batch) if i in failed_idx],
+            )
+        except Exception:
+            logger.exception("Analytics insert failed; requeued %s events", len(batch))
+            return [], batch
+        return batch, []
+
+    async def _write_rollups(self) -> None:
+        """
+        $inc the backlog into event_rollups. On failure the backlog is kept and retried
+        on the next flush, so rollups catch up with the persisted events.
+        """
+        if not self._rollup_backlog:
+            return
+        from pymongo import UpdateOne
+        from pymongo.errors import BulkWriteError
+
+        counts = self._rollup_backlog
+        self._rollup_backlog = Counter()
+        keys = list(counts)
+        try:
+            await get_db().event_rollups.bulk_write(
+                [UpdateOne({"hour": hour, "name": name}, {"$inc": {"count": counts[(hour, name)]}}, upsert=True) for hour, name in keys],
+                ordered=False,
+            )
+        except BulkWriteError as e:
+            # unordered: only the ops listed in writeErrors were not applied
+            failed = [keys[err["index"]] for err in e.details.get("writeErrors", [])]
+            logger.error("Analytics rollup write failed for %s of %s buckets; will retry", len(failed), len(keys))
+            self._rollup_backlog.update({k: counts[k] for k in failed})
+        except Exception:
+            logger.exception("Analytics rollup write failed; will retry on next flush")
+            self._rollup_backlog.update(counts)
+
+    async def _run_timer(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            await self.flush()
+
+    def start(self) -> None:
+        # remembered so track() can schedule flushes from threadpool handlers
+        self._loop = asyncio.get_running_loop()
+        if self._timer is None:
+            self._timer = self._loop.create_task(self._run_timer())
+
+    async def stop(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        await self.flush()
+        if self._events or self._rollup_backlog:
+            logger.warning(
+                "Analytics shutdown left %s events and %s rollup buckets unwritten",
+                len(self._events), len(self._rollup_backlog),
+            )
+        if self.dropped:
+            logger.warning("Analytics dropped %s events since start", self.dropped)
+
+
+_buffer: Optional[EventBuffer] = None
+
+
+def get_buffer() -> EventBuffer:
+    global _buffer
+    if _buffer is None:
+        _buffer = EventBuffer(
+            max_events=settings.analytics_max_events,
+            batch_size=settings.analytics_batch_size,
+            flush_seconds=settings.analytics_flush_seconds,
+        )
+    return _buffer
+
+
+def track(name: str, **props: Any) -> None:
+    get_buffer().track(name, **props)
+
+
+async def ensure_indexes() -> None:
+    db = get_db()
+    await db.events.create_index([("name", 1), ("ts", 1)])
+    await db.event_rollups.create_index([("hour", 1), ("name", 1)], unique=True)
+
+
+async def funnel_counts(start: datetime, end: datetime) -> Dict[str, int]:
+    """
+    Per-step totals for [start, end), read from hourly rollups only.
+    """
+    pipeline = [
+        {"$match": {"hour": {"$gte": _hour(start), "$lt": end}, "name": {"$in": list(FUNNEL)}}},
+        {"$group": {"_id": "$name", "count": {"$sum": "$count"}}},
+    ]
+    out = {step: 0 for step in FUNNEL}
+    async for row in get_db().event_rollups.aggregate(pipeline):
+        out[row["_id"]] = row["count"]
+    return out
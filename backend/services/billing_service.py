@@ -4,26 +4,16 @@ import os
 import hashlib
 from typing import Any, Dict, Optional
 
-import stripe
-
-from core.config import (
-    FRONTEND_URL,
-    STRIPE_API_KEY,
-    STRIPE_PRICE_PRO_MONTHLY,
-    STRIPE_PRICE_ELITE_MONTHLY,
-    STRIPE_PRICE_LAUNCH_AUTHORITY,
-    STRIPE_PRICE_GROWTH_OPERATOR,
-    STRIPE_PRICE_VENTURE_ARCHITECT,
-)
+from core.config import settings
+from services.plan_registry import InvalidPlanError, get_plan
+from services.stripe_service import get_stripe
+from services.analytics_service import track, CHECKOUT_CREATED
 
 # If you store checkout intents in Mongo, keep this import.
 # If your project uses a different DB accessor, replace accordingly.
 from db.mongo import get_client
 
 
-stripe.api_key = STRIPE_API_KEY
-
-
 def _idempotency_key(prefix: str, seed: str | None = None) -> str:
     """
     Deterministic-ish idempotency key to prevent duplicate Stripe objects.
@@ -34,58 +24,15 @@ def _idempotency_key(prefix: str, seed: str | None = None) -> str:
 
 
 def _success_url(origin_url: Optional[str] = None) -> str:
-    base = (origin_url or FRONTEND_URL).rstrip("/")
+    base = (origin_url or settings.frontend_url).rstrip("/")
     return f"{base}/billing/success?session_id={{CHECKOUT_SESSION_ID}}"
 
 
 def _cancel_url(origin_url: Optional[str] = None) -> str:
-    base = (origin_url or FRONTEND_URL).rstrip("/")
+    base = (origin_url or settings.frontend_url).rstrip("/")
     return f"{base}/billing/cancel"
 
 
-def _price_id_for_plan(plan: str) -> str:
-    plan = (plan or "").strip().lower()
-
-    if plan == "pro":
-        if not STRIPE_PRICE_PRO_MONTHLY:
-            raise ValueError("STRIPE_PRICE_PRO_MONTHLY not set")
-        return STRIPE_PRICE_PRO_MONTHLY
-
-    if plan == "elite":
-        if not STRIPE_PRICE_ELITE_MONTHLY:
-            raise ValueError("STRIPE_PRICE_ELITE_MONTHLY not set")
-        return STRIPE_PRICE_ELITE_MONTHLY
-
-    if plan == "launch_authority":
-        if not STRIPE_PRICE_LAUNCH_AUTHORITY:
-            raise ValueError("STRIPE_PRICE_LAUNCH_AUTHORITY not set")
-        return STRIPE_PRICE_LAUNCH_AUTHORITY
-
-    if plan == "growth_operator":
-        if not STRIPE_PRICE_GROWTH_OPERATOR:
-            raise ValueError("STRIPE_PRICE_GROWTH_OPERATOR not set")
-        return STRIPE_PRICE_GROWTH_OPERATOR
-
-    if plan == "venture_architect":
-        if not STRIPE_PRICE_VENTURE_ARCHITECT:
-            raise ValueError("STRIPE_PRICE_VENTURE_ARCHITECT not set")
-        return STRIPE_PRICE_VENTURE_ARCHITECT
-
-    raise ValueError(f"Unknown plan: {plan}")
-
-
-def _mode_for_plan(plan: str) -> str:
-    """
-    Return Stripe Checkout mode: 'subscription' for monthly plans, 'payment' for one-time.
-    """
-    plan = (plan or "").strip().lower()
-    if plan in {"pro", "elite"}:
-        return "subscription"
-    if plan in {"launch_authority", "growth_operator", "venture_architect"}:
-        return "payment"
-    raise ValueError(f"Unknown plan: {plan}")
-
-
 async def create_checkout_session(
     *,
     plan: str,
@@ -107,8 +54,12 @@ async def create_checkout_session(
       - customer_id: existing Stripe customer id (optional)
       - ref_id: client_reference_id (optional)
     """
-    price_id = _price_id_for_plan(plan)
-    mode = _mode_for_plan(plan)
+    plan_info = get_plan(plan)
+    if plan_info.mode not in ("subscription", "payment"):
+        raise InvalidPlanError(f"Plan is not purchasable: {plan_info.key}")
+    plan = plan_info.key
+    price_id = plan_info.require_price_id()
+    mode = plan_info.mode
 
     success_url = _success_url(origin_url)
     cancel_url = _cancel_url(origin_url)
@@ -120,13 +71,14 @@ async def create_checkout_session(
         "plan": plan,
         "user_id": user_id,
         "email": email,
-        "origin_url": (origin_url or FRONTEND_URL),
+        "origin_url": (origin_url or settings.frontend_url),
         "status": "created",
     }
     if intent_id:
         metadata["intent_id"] = intent_id
 
     # Create Stripe Checkout Session (single, correct call; no duplicate kwargs)
+    stripe = get_stripe()
     try:
         session = stripe.checkout.Session.create(
             mode=mode,
@@ -169,12 +121,14 @@ async def create_checkout_session(
                     "mode": mode,
                     "user_id": user_id,
                     "email": email,
-                    "origin_url": (origin_url or FRONTEND_URL),
+                    "origin_url": (origin_url or settings.frontend_url),
                 }
             },
             upsert=True,
         )
 
+    track(CHECKOUT_CREATED, plan=plan, mode=mode, user_id=user_id, session_id=session.id)
+
     return {
         "id": session.id,
         "url": getattr(session, "url", None),
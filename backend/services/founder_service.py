@@ -3,7 +3,9 @@ from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, List, Optional
 from db.mongo import get_db
 from services.task_service import founder_tasks_for_tier, now_iso
-from services.pricing_service import PRICING
+from services.plan_registry import get_plan
+from services.fulfilment_service import enqueue_fulfilment
+from services.analytics_service import track, FOUNDER_PROVISIONED
 
 UPGRADE_CREDIT_DAYS = 365
 
@@ -11,11 +13,8 @@ def _new_id(prefix: str) -> str:
     return f"{prefix}_{uuid.uuid4().hex[:12]}"
 
 def _tier_price_cents(tier: str) -> int:
-    info = PRICING[tier]
-    if info.get("stripe_price_id"):
-        # actual collected amount is from Stripe session; use recorded payment amount for credit
-        return int(info.get("amount_cents_fallback", 0))
-    return int(info.get("amount_cents_fallback", 0))
+    # actual collected amount is from Stripe session; use recorded payment amount for credit
+    return get_plan(tier).amount_cents_fallback
 
 async def create_founder_records_after_payment(user_id: str, email: str, tier: str, amount_paid_cents: int, stripe_session_id: str):
     db = get_db()
@@ -30,7 +29,7 @@ async def create_founder_records_after_payment(user_id: str, email: str, tier: s
         "user_id": user_id,
         "email": email,
         "tier": tier,
-        "tier_name": PRICING[tier]["name"],
+        "tier_name": get_plan(tier).name,
         "amount_paid_cents": amount_paid_cents,
         "stripe_session_id": stripe_session_id,
         "purchase_date": now.isoformat(),
@@ -65,6 +64,10 @@ async def create_founder_records_after_payment(user_id: str, email: str, tier: s
 
     if tasks:
         await db.tasks.insert_many(tasks)
+        # internal tasks are worked off the request path by worker.py
+        await enqueue_fulfilment(tasks)
+
+    track(FOUNDER_PROVISIONED, founder_id=founder_id, tier=tier, amount_paid_cents=amount_paid_cents)
 
     return {"founder_id": founder_id, "business_ids": business_ids, "task_count": len(tasks)}
 
@@ -88,7 +91,7 @@ async def compute_upgrade_due(founder: Dict[str, Any], target_tier: str) -> Dict
         if now <= exp:
             credit = paid
 
-    target_price = int(PRICING[target_tier].get("amount_cents_fallback", 0))
+    target_price = _tier_price_cents(target_tier)
     due = max(0, target_price - credit)
 
     return {"credit_cents": credit, "target_price_cents": target_price, "due_cents": due}
@@ -0,0 +1,60 @@
+from typing import Any, Dict, List
+
+from db.mongo import get_db
+from services.job_service import register, build_job, enqueue_many, PRIORITY_NORMAL, PRIORITY_HIGH
+from services.task_service import INTERNAL_CATEGORIES, now_iso
+
+FULFIL_TASK_JOB = "fulfil_task"
+
+# Founder-level setup unblocks the per-business work, so run it first
+CATEGORY_PRIORITY = {
+    "crm_setup": PRIORITY_HIGH,
+    "banking_advisory": PRIORITY_HIGH,
+}
+
+
+def fulfilment_jobs_for_tasks(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    One job per internal task. Partner-routed tasks are fulfilled by the partner, not a worker.
+    """
+    return [
+        build_job(
+            FULFIL_TASK_JOB,
+            {"task_id": t["id"], "founder_id": t.get("founder_id"), "category": t["category"]},
+            priority=CATEGORY_PRIORITY.get(t["category"], PRIORITY_NORMAL),
+            dedupe_key=f"{FULFIL_TASK_JOB}:{t['id']}",
+        )
+        for t in tasks
+        if t.get("assigned_type") == "internal" and t.get("category") in INTERNAL_CATEGORIES
+    ]
+
+
+async def enqueue_fulfilment(tasks: List[Dict[str, Any]]) -> List[str]:
+    return await enqueue_many(fulfilment_jobs_for_tasks(tasks))
+
+
+@register(FULFIL_TASK_JOB)
+async def fulfil_task(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Records that a fulfilment job picked up an internal task. No automated fulfilment
+    step exists yet, so the task's status is left for whoever does the work to advance.
+    Safe to re-run: a task already claimed by a job is left untouched.
+    """
+    db = get_db()
+    task_id = job["payload"]["task_id"]
+
+    task = await db.tasks.find_one({"id": task_id})
+    if not task:
+        raise ValueError(f"Task not found: {task_id}")
+
+    res = await db.tasks.update_one(
+        {"id": task_id, "fulfilment_job_id": None},
+        {
+            "$set": {
+                "fulfilment_job_id": job["id"],
+                "fulfilment_picked_up_at": now_iso(),
+                "updated_at": now_iso(),
+            }
+        },
+    )
+    return {"task_id": task_id, "picked_up": res.modified_count == 1}
@@ -0,0 +1,357 @@
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timezone, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from pymongo import ASCENDING, DESCENDING, InsertOne, ReturnDocument, UpdateOne
+
+from db.mongo import get_db
+from services.task_service import now_iso
+
+logger = logging.getLogger("PEN2PRO_V2.jobs")
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+HANDLERS: Dict[str, JobHandler] = {}
+
+DEFAULT_LEASE_SECONDS = 60
+DEFAULT_MAX_ATTEMPTS = 5
+BACKOFF_BASE_SECONDS = 10
+BACKOFF_MAX_SECONDS = 3600
+
+# Higher runs first
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 5
+PRIORITY_HIGH = 10
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _new_id(prefix: str) -> str:
+    return f"{prefix}_{uuid.uuid4().hex[:12]}"
+
+
+def register(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """
+    Decorator: register an async handler for a job kind.
+    The handler receives the full job document and may raise to trigger a retry.
+    """
+    def deco(fn: JobHandler) -> JobHandler:
+        HANDLERS[kind] = fn
+        return fn
+    return deco
+
+
+def backoff_seconds(attempts: int) -> int:
+    """
+    Exponential backoff: 10s, 20s, 40s, ... capped at one hour.
+    """
+    return min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** max(0, attempts - 1)))
+
+
+async def ensure_indexes() -> None:
+    db = get_db()
+    # claim query: status + run_at, ordered by priority then run_at
+    await db.jobs.create_index([("status", ASCENDING), ("priority", DESCENDING), ("run_at", ASCENDING)])
+    # lease reclaim query
+    await db.jobs.create_index([("status", ASCENDING), ("lease_expires_at", ASCENDING)])
+    await db.jobs.create_index("id", unique=True)
+    await db.jobs.create_index("dedupe_key", unique=True, sparse=True)
+
+
+async def enqueue(
+    kind: str,
+    payload: Dict[str, Any],
+    *,
+    priority: int = PRIORITY_NORMAL,
+    run_at: Optional[datetime] = None,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    dedupe_key: Optional[str] = None,
+) -> str:
+    """
+    Insert a job. With dedupe_key, enqueueing the same key twice is a no-op and
+    returns the existing job id.
+    """
+    db = get_db()
+    job = build_job(kind, payload, priority=priority, run_at=run_at, max_attempts=max_attempts, dedupe_key=dedupe_key)
+
+    if dedupe_key:
+        res = await db.jobs.find_one_and_update(
+            {"dedupe_key": dedupe_key},
+            {"$setOnInsert": job},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return res["id"]
+
+    await db.jobs.insert_one(job)
+    return job["id"]
+
+
+async def enqueue_many(jobs: Iterable[Dict[str, Any]]) -> List[str]:
+    """
+    Bulk enqueue jobs built with build_job(); one round trip. Jobs with a dedupe_key
+    follow enqueue()'s rule: an existing job with the same key is left alone.
+    Returns the ids of the jobs actually created.
+    """
+    docs = list(jobs)
+    if not docs:
+        return []
+
+    ops = [
+        UpdateOne({"dedupe_key": d["dedupe_key"]}, {"$setOnInsert": d}, upsert=True) if d.get("dedupe_key") else InsertOne(d)
+        for d in docs
+    ]
+    res = await get_db().jobs.bulk_write(ops, ordered=False)
+    return [d["id"] for i, d in enumerate(docs) if not d.get("dedupe_key") or i in res.upserted_ids]
+
+
+def build_job(
+    kind: str,
+    payload: Dict[str, Any],
+    *,
+    priority: int = PRIORITY_NORMAL,
+    run_at: Optional[datetime] = None,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    dedupe_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    job = {
+        "id": _new_id("job"),
+        "kind": kind,
+        "payload": payload,
+        "status": "queued",       # queued | running | done | failed
+        "priority": priority,
+        "run_at": run_at or _now(),
+        "attempts": 0,
+        "max_attempts": max_attempts,
+        "lease_owner": None,
+        "lease_expires_at": None,
+        "last_error": None,
+        "created_at": now_iso(),
+        "updated_at": now_iso(),
+    }
+    if dedupe_key:
+        job["dedupe_key"] = dedupe_key
+    return job
+
+
+async def claim_next(worker_id: str, kinds: Optional[List[str]] = None, lease_seconds: int = DEFAULT_LEASE_SECONDS) -> Optional[Dict[str, Any]]:
+    """
+    Atomically lease the highest-priority runnable job.
+    A job is runnable if it is queued and due, or running with an expired lease
+    (its worker died mid-run) and attempts remain. Expired jobs with no attempts
+    left are marked failed by fail_exhausted().
+    """
+    db = get_db()
+    now = _now()
+
+    query: Dict[str, Any] = {
+        "$or": [
+            {"status": "queued", "run_at": {"$lte": now}},
+            {
+                "status": "running",
+                "lease_expires_at": {"$lt": now},
+                "$expr": {"$lt": ["$attempts", "$max_attempts"]},
+            },
+        ]
+    }
+    if kinds:
+        query["kind"] = {"$in": kinds}
+
+    return await db.jobs.find_one_and_update(
+        query,
+        {
+            "$set": {
+                "status": "running",
+                "lease_owner": worker_id,
+                "lease_expires_at": now + timedelta(seconds=lease_seconds),
+                "updated_at": now_iso(),
+            },
+            "$inc": {"attempts": 1},
+        },
+        sort=[("priority", DESCENDING), ("run_at", ASCENDING)],
+        return_document=ReturnDocument.AFTER,
+    )
+
+
+async def fail_exhausted() -> int:
+    """
+    Mark failed any job whose lease expired on its last attempt. These jobs crashed
+    their worker on every try and so never reached fail(). Returns the number marked.
+    """
+    res = await get_db().jobs.update_many(
+        {
+            "status": "running",
+            "lease_expires_at": {"$lt": _now()},
+            "$expr": {"$gte": ["$attempts", "$max_attempts"]},
+        },
+        {
+            "$set": {
+                "status": "failed",
+                "lease_owner": None,
+                "lease_expires_at": None,
+                "last_error": "Lease expired on final attempt (worker died)",
+                "finished_at": now_iso(),
+                "updated_at": now_iso(),
+            }
+        },
+    )
+    return res.modified_count
+
+
+async def extend_lease(job: Dict[str, Any], worker_id: str, lease_seconds: int = DEFAULT_LEASE_SECONDS) -> bool:
+    res = await get_db().jobs.update_one(
+        {"id": job["id"], "status": "running", "lease_owner": worker_id},
+        {"$set": {"lease_expires_at": _now() + timedelta(seconds=lease_seconds)}},
+    )
+    return res.modified_count == 1
+
+
+async def complete(job: Dict[str, Any], worker_id: str, result: Any = None) -> None:
+    await get_db().jobs.update_one(
+        {"id": job["id"], "lease_owner": worker_id},
+        {
+            "$set": {
+                "status": "done",
+                "result": result,
+                "lease_owner": None,
+                "lease_expires_at": None,
+                "finished_at": now_iso(),
+                "updated_at": now_iso(),
+            }
+        },
+    )
+
+
+async def fail(job: Dict[str, Any], worker_id: str, error: str) -> None:
+    """
+    Reschedule with backoff, or mark failed once max_attempts is reached.
+    """
+    attempts = int(job.get("attempts", 0))
+    update: Dict[str, Any] = {
+        "lease_owner": None,
+        "lease_expires_at": None,
+        "last_error": error,
+        "updated_at": now_iso(),
+    }
+    if attempts >= int(job.get("max_attempts", DEFAULT_MAX_ATTEMPTS)):
+        update["status"] = "failed"
+        update["finished_at"] = now_iso()
+    else:
+        update["status"] = "queued"
+        update["run_at"] = _now() + timedelta(seconds=backoff_seconds(attempts))
+
+    await get_db().jobs.update_one({"id": job["id"], "lease_owner": worker_id}, {"$set": update})
+
+
+class Worker:
+    """
+    Polls the jobs collection and runs handlers under asyncio.
+    `concurrency` slots each claim and run one job at a time; a heartbeat keeps the
+    lease alive while a handler runs so long jobs are not reclaimed by other workers.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        kinds: Optional[List[str]] = None,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+        poll_interval: float = 1.0,
+        worker_id: Optional[str] = None,
+        reap_interval: Optional[float] = None,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.kinds = kinds
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        # how often this worker sweeps for exhausted expired leases
+        self.reap_interval = reap_interval if reap_interval is not None else float(lease_seconds)
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run(self) -> None:
+        await ensure_indexes()
+        logger.info("Worker %s started (concurrency=%s)", self.worker_id, self.concurrency)
+        await asyncio.gather(self._reaper(), *(self._slot() for _ in range(self.concurrency)))
+        logger.info("Worker %s stopped", self.worker_id)
+
+    async def _slot(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                job = await claim_next(self.worker_id, self.kinds, self.lease_seconds)
+            except Exception:
+                logger.exception("Job claim failed")
+                job = None
+
+            if job is None:
+                await self._sleep(self.poll_interval)
+                continue
+
+            await self._run_job(job)
+
+    async def _sleep(self, seconds: float) -> None:
+        # returns early when stop() is called
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _reaper(self) -> None:
+        """
+        One per worker, not per slot: fail_exhausted() is a collection-wide update.
+        """
+        while not self._stopping.is_set():
+            try:
+                await fail_exhausted()
+            except Exception:
+                logger.exception("Failing exhausted jobs failed")
+            await self._sleep(self.reap_interval)
+
+    async def _heartbeat(self, job: Dict[str, Any]) -> None:
+        interval = max(1.0, self.lease_seconds / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                extended = await extend_lease(job, self.worker_id, self.lease_seconds)
+            except Exception:
+                # transient Mongo error: keep trying while the lease is still live
+                logger.exception("Lease extension failed for job %s; retrying", job["id"])
+                continue
+            if not extended:
+                logger.warning("Lost lease on job %s", job["id"])
+                return
+
+    async def _run_job(self, job: Dict[str, Any]) -> None:
+        handler = HANDLERS.get(job["kind"])
+        if handler is None:
+            await self._record(fail(job, self.worker_id, f"No handler for job kind: {job['kind']}"), job)
+            return
+
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            result = await handler(job)
+        except Exception as e:
+            logger.exception("Job %s (%s) failed on attempt %s", job["id"], job["kind"], job.get("attempts"))
+            await self._record(fail(job, self.worker_id, f"{type(e).__name__}: {e}"), job)
+        else:
+            await self._record(complete(job, self.worker_id, result), job)
+        finally:
+            heartbeat.cancel()
+
+    async def _record(self, outcome: Awaitable[None], job: Dict[str, Any]) -> None:
+        """
+        Persist a job outcome without letting a Mongo error kill the worker.
+        If it can't be written the lease expires and the job is reclaimed.
+        """
+        try:
+            await outcome
+        except Exception:
+            logger.exception("Recording outcome for job %s failed; it will be reclaimed after its lease", job["id"])
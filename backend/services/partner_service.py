@@ -1,11 +1,8 @@
 import uuid
-import stripe
 from typing import Dict, Any
-from core.config import STRIPE_CONNECT_RETURN_URL, STRIPE_CONNECT_REFRESH_URL
+from core.config import settings
 from db.mongo import get_db
-from core.config import STRIPE_SECRET_KEY
-
-stripe.api_key = STRIPE_SECRET_KEY
+from services.stripe_service import get_stripe
 
 def _new_id(prefix: str) -> str:
     return f"{prefix}_{uuid.uuid4().hex[:12]}"
@@ -27,6 +24,7 @@ async def onboard_partner_express(partner_id: str, email: str) -> Dict[str, Any]
     Creates/attaches a Stripe Connect Express account and returns onboarding link.
     """
     db = get_db()
+    stripe = get_stripe()
 
     existing = await db.partner_accounts.find_one({"partner_id": partner_id})
     if existing and existing.get("stripe_account_id"):
@@ -46,8 +44,8 @@ async def onboard_partner_express(partner_id: str, email: str) -> Dict[str, Any]
 
     link = stripe.AccountLink.create(
         account=acct_id,
-        refresh_url=STRIPE_CONNECT_REFRESH_URL,
-        return_url=STRIPE_CONNECT_RETURN_URL,
+        refresh_url=settings.stripe_connect_refresh_url,
+        return_url=settings.stripe_connect_return_url,
         type="account_onboarding"
     )
 
@@ -1,9 +1,7 @@
-import stripe
 from typing import Dict, Any
-from core.config import STRIPE_SECRET_KEY
 from db.mongo import get_db
-
-stripe.api_key = STRIPE_SECRET_KEY
+from services.stripe_service import get_stripe
+from services.analytics_service import track, PAYOUT_SENT
 
 PLATFORM_TAKE_RATE = 0.20  # 20%
 
@@ -30,7 +28,7 @@ async def release_partner_payout(order_id: str, milestone_id: str) -> Dict[str,
 
     partner_share = int(round(amount_cents * (1.0 - PLATFORM_TAKE_RATE)))
 
-    transfer = stripe.Transfer.create(
+    transfer = get_stripe().Transfer.create(
         amount=partner_share,
         currency=order.get("currency", "usd"),
         destination=partner_account_id,
@@ -47,4 +45,6 @@ async def release_partner_payout(order_id: str, milestone_id: str) -> Dict[str,
         "created_at": __import__("datetime").datetime.utcnow().isoformat(),
     })
 
+    track(PAYOUT_SENT, order_id=order_id, milestone_id=milestone_id, amount_cents=partner_share)
+
     return {"success": True, "transfer_id": transfer.id, "amount_cents": partner_share}
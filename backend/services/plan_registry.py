@@ -0,0 +1,263 @@
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from db.mongo import get_db
+
+logger = logging.getLogger("PEN2PRO_V2.plans")
+
+
+class InvalidPlanError(ValueError):
+    """
+    The caller asked for a plan that doesn't exist or can't be bought (a client error).
+    Missing price config is a plain ValueError: that's a server problem.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class Plan:
+    key: str
+    name: str
+    mode: str                      # "subscription" | "payment" | "none"
+    price_display: str
+    features: Tuple[str, ...] = ()
+    stripe_price_id: Optional[str] = None
+    price_env: Optional[str] = None  # env var the price id came from, for error messages
+    amount_cents_fallback: int = 0
+
+    def require_price_id(self) -> str:
+        if not self.stripe_price_id:
+            raise ValueError(f"{self.price_env or self.key} not set")
+        return self.stripe_price_id
+
+    def as_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "name": self.name,
+            "mode": self.mode,
+            "price_display": self.price_display,
+            "features": list(self.features),
+        }
+        if self.stripe_price_id is not None or self.price_env:
+            out["stripe_price_id"] = self.stripe_price_id
+        if self.amount_cents_fallback:
+            out["amount_cents_fallback"] = self.amount_cents_fallback
+        return out
+
+
+# Built-in catalog. Price ids come from env; a Mongo `plans` document with the same key overrides any field.
+DEFAULT_PLANS: Tuple[Dict[str, Any], ...] = (
+    {
+        "key": "free",
+        "name": "Free Forever",
+        "mode": "none",
+        "price_display": "$0",
+        "features": ["3 RMIE plans/month", "Basic scoring", "Limited dashboard"],
+    },
+    {
+        "key": "pro",
+        "name": "Pro",
+        "mode": "subscription",
+        "price_display": "$49/mo",
+        "price_env": "STRIPE_PRICE_PRO_MONTHLY",
+        "features": ["Unlimited RMIE plans", "Deep Research GPT", "Marketplace access (standard)"],
+    },
+    {
+        "key": "elite",
+        "name": "Elite",
+        "mode": "subscription",
+        "price_display": "$149/mo",
+        "price_env": "STRIPE_PRICE_ELITE_MONTHLY",
+        "features": ["Execution Architect GPT", "Affiliate Monetization GPT", "Preferred marketplace pricing"],
+    },
+    {
+        "key": "launch_authority",
+        "name": "Launch Authority",
+        "mode": "payment",
+        "price_display": "$499.99 one-time",
+        "price_env": "STRIPE_PRICE_LAUNCH_AUTHORITY",
+        "amount_cents_fallback": 49999,
+        "features": ["1 Business", "LLC/EIN routed", "Branding", "Website", "Credit roadmap", "Affiliate starter"],
+    },
+    {
+        "key": "growth_operator",
+        "name": "Growth Operator",
+        "mode": "payment",
+        "price_display": "$999.99 one-time",
+        "price_env": "STRIPE_PRICE_GROWTH_OPERATOR",
+        "amount_cents_fallback": 99999,
+        "features": ["2 Businesses", "CRM setup", "Banking advisory", "Advanced affiliate stack", "Capital roadmap"],
+    },
+    {
+        "key": "venture_architect",
+        "name": "Venture Architect",
+        "mode": "payment",
+        "price_display": "$1999.99 one-time",
+        "price_env": "STRIPE_PRICE_VENTURE_ARCHITECT",
+        "amount_cents_fallback": 199999,
+        "features": ["Trademark routed", "White-glove onboarding", "Investor-ready docs", "Venture Scale GPT"],
+    },
+)
+
+
+def _plan_from_doc(doc: Mapping[str, Any]) -> Plan:
+    price_env = doc.get("price_env")
+    price_id = doc.get("stripe_price_id")
+    if price_id is None and price_env:
+        price_id = os.getenv(price_env)
+    return Plan(
+        key=doc["key"],
+        name=doc["name"],
+        mode=doc["mode"],
+        price_display=doc.get("price_display", ""),
+        features=tuple(doc.get("features") or ()),
+        stripe_price_id=price_id or None,
+        price_env=price_env,
+        amount_cents_fallback=int(doc.get("amount_cents_fallback") or 0),
+    )
+
+
+class PlanRegistry:
+    """
+    Immutable snapshot of the plan catalog with O(1) lookup by plan key and by Stripe price id.
+    Reloads build a new registry and swap the module-level reference, so readers never see
+    a half-updated catalog and need no locking.
+    """
+
+    __slots__ = ("_by_key", "_by_price_id")
+
+    def __init__(self, plans: Iterable[Plan]):
+        self._by_key: Dict[str, Plan] = {p.key: p for p in plans}
+        self._by_price_id: Dict[str, Plan] = {p.stripe_price_id: p for p in self._by_key.values() if p.stripe_price_id}
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, PlanRegistry) and self._by_key == other._by_key
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._by_key
+
+    def get(self, key: str) -> Optional[Plan]:
+        return self._by_key.get(key)
+
+    def by_price_id(self, price_id: str) -> Optional[Plan]:
+        return self._by_price_id.get(price_id)
+
+    def plans(self) -> List[Plan]:
+        return list(self._by_key.values())
+
+
+def plans_from_env() -> List[Plan]:
+    return [_plan_from_doc(d) for d in DEFAULT_PLANS]
+
+
+async def plans_from_mongo() -> List[Plan]:
+    """
+    Env catalog overlaid with the `plans` collection. Documents are matched on `key`;
+    `active: false` removes a plan, unknown keys add new plans.
+    """
+    merged: Dict[str, Dict[str, Any]] = {d["key"]: dict(d) for d in DEFAULT_PLANS}
+    async for doc in get_db().plans.find({}, {"_id": 0}):
+        key = doc.get("key")
+        if not key:
+            continue
+        if doc.get("active") is False:
+            merged.pop(key, None)
+            continue
+        merged[key] = {**merged.get(key, {}), **doc}
+    return [_plan_from_doc(d) for d in merged.values()]
+
+
+_registry = PlanRegistry(plans_from_env())
+
+
+def get_registry() -> PlanRegistry:
+    return _registry
+
+
+def set_registry(registry: PlanRegistry) -> None:
+    global _registry
+    _registry = registry
+
+
+def get_plan(key: str) -> Plan:
+    """
+    Hot path: exact key lookup with no string work. Non-canonical input ("Pro ", "ELITE")
+    falls back to a normalized lookup only on a miss.
+    """
+    plan = _registry.get(key)
+    if plan is None:
+        plan = _registry.get((key or "").strip().lower())
+        if plan is None:
+            raise InvalidPlanError(f"Unknown plan: {key}")
+    return plan
+
+
+def plan_for_price_id(price_id: str) -> Optional[Plan]:
+    return _registry.by_price_id(price_id)
+
+
+async def reload_plans() -> bool:
+    """
+    Rebuild the registry from env + Mongo. Returns True if the catalog changed.
+    """
+    registry = PlanRegistry(await plans_from_mongo())
+    if registry == _registry:
+        return False
+    set_registry(registry)
+    logger.info("Plan registry reloaded (%s plans)", len(registry.plans()))
+    return True
+
+
+# Server error codes meaning "change streams are not available on this deployment"
+# (40573: standalone mongod, not a replica set)
+_CHANGE_STREAM_UNSUPPORTED_CODES = {40573}
+
+
+def _change_streams_unsupported(e: Exception) -> bool:
+    from pymongo.errors import OperationFailure
+
+    return isinstance(e, OperationFailure) and (
+        e.code in _CHANGE_STREAM_UNSUPPORTED_CODES or "only supported on replica sets" in str(e)
+    )
+
+
+async def _reload_logged() -> None:
+    try:
+        await reload_plans()
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        logger.exception("Plan registry reload failed; keeping current catalog")
+
+
+async def watch_plans(poll_seconds: float = 30.0) -> None:
+    """
+    Keep this process's registry in sync with the `plans` collection.
+    Uses a change stream when the deployment supports one (replica set / Atlas),
+    reopening it after transient errors such as a primary stepdown. Falls back to
+    polling every `poll_seconds` only when change streams are unsupported.
+    """
+    retry_seconds = 1.0
+    while True:
+        try:
+            async with get_db().plans.watch() as stream:
+                logger.info("Watching plans via change stream")
+                retry_seconds = 1.0
+                async for _ in stream:
+                    await _reload_logged()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if _change_streams_unsupported(e):
+                logger.info("Plan change streams not supported (%s); polling every %ss", e, poll_seconds)
+                break
+            logger.warning("Plan change stream interrupted (%s: %s); reopening in %ss", type(e).__name__, e, retry_seconds)
+            await asyncio.sleep(retry_seconds)
+            retry_seconds = min(retry_seconds * 2, poll_seconds)
+            # changes may have landed while the stream was down
+            await _reload_logged()
+
+    while True:
+        await asyncio.sleep(poll_seconds)
+        await _reload_logged()
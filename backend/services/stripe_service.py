@@ -1,7 +1,52 @@
-import stripe
-from core.config import STRIPE_SECRET_KEY, STRIPE_WEBHOOK_SECRET
+from typing import Any
+from core.config import settings
+
+_stripe = None
+_api_key_set = False
+
+
+class InvalidWebhookError(Exception):
+    """
+    Webhook payload is malformed or its signature doesn't verify (a client error).
+    """
+
+
+def _stripe_module() -> Any:
+    """
+    The `stripe` SDK, imported on first use. Doesn't need an API key, so webhook
+    verification works with only STRIPE_WEBHOOK_SECRET set.
+    """
+    global _stripe
+    if _stripe is None:
+        import stripe
+        _stripe = stripe
+    return _stripe
+
+
+def get_stripe() -> Any:
+    """
+    Returns the `stripe` module with its API key set, for API calls
+    (Session.create, Transfer.create, ...). Raises ValueError if the key isn't configured.
+    """
+    global _api_key_set
+    stripe = _stripe_module()
+    if not _api_key_set:
+        stripe.api_key = settings.stripe_api_key
+        _api_key_set = True
+    return stripe
 
-stripe.api_key = STRIPE_SECRET_KEY
 
 def construct_event(payload: bytes, sig_header: str):
-    return stripe.Webhook.construct_event(payload, sig_header, STRIPE_WEBHOOK_SECRET)
+    """
+    Verify and parse a webhook. Raises InvalidWebhookError for a bad payload or
+    signature; a missing STRIPE_WEBHOOK_SECRET still raises ValueError (server config).
+    """
+    secret = settings.stripe_webhook_secret
+    stripe = _stripe_module()
+    try:
+        return stripe.Webhook.construct_event(payload, sig_header, secret)
+    except stripe.SignatureVerificationError as e:
+        raise InvalidWebhookError("Invalid signature") from e
+    except ValueError as e:
+        # stripe raises ValueError for an unparseable payload
+        raise InvalidWebhookError("Invalid payload") from e
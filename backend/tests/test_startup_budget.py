@@ -0,0 +1,17 @@
+import os
+import statistics
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.profile_imports import DEFAULT_BUDGET_MS, measure_ms  # noqa: E402
+
+
+# Wall-clock timing flakes on loaded runners: opt in by setting IMPORT_BUDGET_MS
+@pytest.mark.skipif("IMPORT_BUDGET_MS" not in os.environ, reason="set IMPORT_BUDGET_MS to run the startup budget check")
+def test_server_import_within_budget():
+    # fresh interpreter per run; IMPORT_BUDGET_MS overrides the budget
+    median = statistics.median(measure_ms(runs=5))
+    assert median <= DEFAULT_BUDGET_MS, f"import server:app took {median:.1f} ms (budget {DEFAULT_BUDGET_MS:.0f} ms)"
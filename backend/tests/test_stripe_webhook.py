@@ -0,0 +1,73 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+WEBHOOK_SECRET = "whsec_test"
+
+
+def _sign(payload: bytes, secret: str = WEBHOOK_SECRET) -> str:
+    ts = int(time.time())
+    sig = hmac.new(secret.encode(), f"{ts}.".encode() + payload, hashlib.sha256).hexdigest()
+    return f"t={ts},v1={sig}"
+
+
+def _post(payload: bytes, signature: str) -> httpx.Response:
+    import server
+
+    async def go():
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(
+                "/api/webhooks/stripe",
+                content=payload,
+                headers={"Stripe-Signature": signature, "Content-Type": "application/json"},
+            )
+
+    return asyncio.run(go())
+
+
+def _event(event_type: str, obj: dict) -> bytes:
+    return json.dumps({"id": "evt_1", "object": "event", "type": event_type, "data": {"object": obj}}).encode()
+
+
+def test_bad_signature_is_400_without_api_key(monkeypatch):
+    # only the webhook secret is configured; verification must not need STRIPE_API_KEY
+    monkeypatch.setenv("STRIPE_WEBHOOK_SECRET", WEBHOOK_SECRET)
+    monkeypatch.delenv("STRIPE_API_KEY", raising=False)
+    monkeypatch.delenv("STRIPE_SECRET_KEY", raising=False)
+    from core.config import settings
+    monkeypatch.delitem(settings.__dict__, "stripe_webhook_secret", raising=False)
+
+    payload = _event("invoice.paid", {"id": "in_1", "object": "invoice"})
+    resp = _post(payload, _sign(payload, secret="whsec_wrong"))
+
+    assert resp.status_code == 400
+    assert resp.json() == {"detail": "Invalid signature"}
+
+
+def test_checkout_completed_records_funnel_event(monkeypatch):
+    monkeypatch.setenv("STRIPE_WEBHOOK_SECRET", WEBHOOK_SECRET)
+    from core.config import settings
+    from services import analytics_service
+    monkeypatch.delitem(settings.__dict__, "stripe_webhook_secret", raising=False)
+    buffer = analytics_service.EventBuffer(max_events=100, batch_size=100, flush_seconds=60)
+    monkeypatch.setattr(analytics_service, "_buffer", buffer)
+
+    for metadata, plan in (({"plan": "launch_authority", "user_id": "u1"}, "launch_authority"), (None, None)):
+        session = {"id": "cs_1", "object": "checkout.session", "metadata": metadata}
+        payload = _event("checkout.session.completed", session)
+        resp = _post(payload, _sign(payload))
+
+        assert resp.status_code == 200
+        assert resp.json() == {"status": "success"}
+        event = buffer._events[-1]
+        assert event["name"] == analytics_service.WEBHOOK_COMPLETED
+        assert event["props"] == {"session_id": "cs_1", "plan": plan}
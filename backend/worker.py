@@ -0,0 +1,30 @@
+import asyncio
+import logging
+import signal
+
+from core.config import settings
+from services.job_service import Worker
+
+# Import handler modules so their @register() calls run
+import services.fulfilment_service  # noqa: F401
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("PEN2PRO_V2")
+
+
+async def main():
+    worker = Worker(
+        concurrency=settings.job_worker_concurrency,
+        lease_seconds=settings.job_lease_seconds,
+        poll_interval=settings.job_worker_poll_seconds,
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    await worker.run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())